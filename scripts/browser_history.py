@@ -12,10 +12,8 @@ Usage:
 import argparse
 import os
 import platform
-import shutil
 import sqlite3
 import sys
-import tempfile
 from datetime import datetime, timezone
 from pathlib import Path
 
@@ -25,6 +23,9 @@ CHROMIUM_EPOCH_OFFSET = 11644473600 * 1_000_000
 # Insert a gap marker when visits are more than this many seconds apart
 GAP_THRESHOLD_SECONDS = 30 * 60  # 30 minutes
 
+# Formatted lines are flushed to the output file in batches of this size
+WRITE_BATCH_LINES = 4096
+
 # Browser history DB paths per platform (Edge first, Chrome fallback)
 _system = platform.system()
 if _system == "Darwin":
@@ -58,12 +59,6 @@ def chromium_ts(dt):
     return int(dt.timestamp() * 1_000_000) + CHROMIUM_EPOCH_OFFSET
 
 
-def chromium_to_local(ts):
-    """Convert Chromium timestamp to local datetime."""
-    unix_us = ts - CHROMIUM_EPOCH_OFFSET
-    return datetime.fromtimestamp(unix_us / 1_000_000)
-
-
 def format_duration(microseconds):
     """Format visit duration as a human-readable string."""
     if not microseconds or microseconds <= 0:
@@ -78,8 +73,79 @@ def format_duration(microseconds):
     return f"{hours:.0f}h{minutes % 60:.0f}m"
 
 
+def connect_readonly(path, immutable=False):
+    """Open a history DB read-only, tuned for a single sequential scan.
+
+    immutable=True tells SQLite the file cannot change underneath it, so it
+    skips file locking and change detection entirely.
+    """
+    mode = "ro&immutable=1" if immutable else "ro"
+    # timeout=0: a lock held by the browser should fail fast, not be waited on
+    conn = sqlite3.connect(f"{Path(path).as_uri()}?mode={mode}", uri=True, timeout=0)
+    if immutable:
+        # Only safe without locking: on a plain read-only handle these do
+        # nothing useful, and journal_mode=OFF fails outright on a WAL DB
+        conn.executescript("PRAGMA journal_mode=OFF; PRAGMA synchronous=OFF;")
+    conn.executescript(
+        """
+        PRAGMA temp_store=MEMORY;
+        PRAGMA mmap_size=268435456;
+        PRAGMA cache_size=-65536;
+        PRAGMA query_only=1;
+        """
+    )
+    return conn
+
+
+def open_history(db_path):
+    """Open the browser's history DB without copying the file.
+
+    Usually the browser isn't running, so a plain read-only open sees a
+    consistent DB. While it runs, the browser holds the DB locked; reading
+    it in place with immutable=1 sidesteps the lock. If that fails too,
+    SQLite's online backup API snapshots it into a private temporary DB.
+    SQLite puts that in the system temp dir (TMPDIR / %TEMP%, often tmpfs)
+    and deletes it when the connection closes, or when the process dies.
+    Returns a connection, or None if the DB could not be read.
+    """
+    for immutable in (False, True):
+        conn = None
+        try:
+            conn = connect_readonly(db_path, immutable)
+            # Keep one read transaction open for the whole extraction, so the
+            # totals and the rows come from the same snapshot and a browser
+            # starting up mid-run can't make later queries fail with BUSY
+            conn.execute("BEGIN")
+            conn.execute("SELECT 1 FROM visits LIMIT 1")
+            return conn
+        except sqlite3.DatabaseError:
+            if conn is not None:
+                conn.close()
+
+    try:
+        src = sqlite3.connect(f"{Path(db_path).as_uri()}?mode=ro", uri=True, timeout=2)
+        try:
+            # Take the read lock up front: backup() itself retries forever on BUSY
+            src.execute("BEGIN")
+            src.execute("SELECT 1 FROM visits LIMIT 1")
+            conn = sqlite3.connect("")
+            src.backup(conn)
+        finally:
+            src.close()
+    except sqlite3.DatabaseError as e:
+        print(f"Warning: Could not read browser history ({e}). Browser might be locking it.", file=sys.stderr)
+        print("Try closing the browser or copying the file manually.", file=sys.stderr)
+        return None
+    return conn
+
+
 def extract_history(db_path, date_str):
-    """Extract all visits for a given date."""
+    """Extract all visits for a given date.
+
+    Returns (rows, total, unique) where rows lazily yields
+    (gap_us, time_str, visit_duration, title_and_url) tuples, or
+    (None, 0, 0) if the history DB could not be read.
+    """
     date = datetime.strptime(date_str, "%Y-%m-%d")
     # Use local timezone for day boundaries so "today" means the user's local day
     day_start = datetime(date.year, date.month, date.day).astimezone()
@@ -88,74 +154,113 @@ def extract_history(db_path, date_str):
     ts_start = chromium_ts(day_start)
     ts_end = chromium_ts(day_end)
 
-    # Copy DB to temp file because the browser locks it while running
-    tmp_fd, tmp_path = tempfile.mkstemp(suffix=".db", prefix="browser_history_")
-    os.close(tmp_fd)
-    try:
-        shutil.copy2(db_path, tmp_path)
-    except (PermissionError, OSError) as e:
-        print(f"Warning: Could not copy browser history ({e}). Browser might be locking it.", file=sys.stderr)
-        print("Try closing the browser or copying the file manually.", file=sys.stderr)
-        os.unlink(tmp_path)
+    conn = open_history(db_path)
+    if conn is None:
         return None, 0, 0
 
     try:
-        conn = sqlite3.connect(tmp_path)
-        cur = conn.cursor()
-
-        cur.execute(
-            """
-            SELECT v.visit_time, v.visit_duration, u.url, u.title
-            FROM visits v
+        # Boundary check: a day outside the recorded history is answered without
+        # touching the visits range at all. MIN and MAX sit in separate subqueries
+        # because SQLite's one-seek min/max shortcut only applies to a query with a
+        # single such aggregate; together they would scan the whole index.
+        first, last = conn.execute(
+            "SELECT (SELECT MIN(visit_time) FROM visits), (SELECT MAX(visit_time) FROM visits)"
+        ).fetchone()
+        if first is None or ts_end <= first or ts_start > last:
+            conn.close()
+            return iter(()), 0, 0
+
+        # Pin the range scans to Chromium's visit_time index: the DB is opened
+        # read-only, so stale ANALYZE stats can't be refreshed (PRAGMA optimize
+        # would have to write) and could otherwise steer the planner to a full scan
+        has_index = conn.execute(
+            "SELECT 1 FROM sqlite_master WHERE type = 'index' AND name = 'visits_time_index'"
+        ).fetchone()
+        visits = "visits v INDEXED BY visits_time_index" if has_index else "visits v"
+
+        # Totals come from SQLite up front so the header can be written first.
+        # Chromium keeps one urls row per URL, so distinct URLs are counted on
+        # the integer url id rather than by hashing every URL string
+        total, unique_urls = conn.execute(
+            f"""
+            SELECT COUNT(*), COUNT(DISTINCT v.url)
+            FROM {visits}
             JOIN urls u ON v.url = u.id
             WHERE v.visit_time >= ? AND v.visit_time < ?
-            ORDER BY v.visit_time ASC
             """,
             (ts_start, ts_end),
-        )
-        rows = cur.fetchall()
-
-        unique_urls = len(set(r[2] for r in rows))
+        ).fetchone()
+    except BaseException:
+        conn.close()
+        raise
 
+    # Nothing to stream on an empty day: skip the row query entirely
+    if not total:
         conn.close()
-        return rows, len(rows), unique_urls
+        return iter(()), 0, 0
+
+    return _iter_visits(conn, visits, ts_start, ts_end), total, unique_urls
+
+
+def _iter_visits(conn, visits, ts_start, ts_end):
+    """Yield visit rows straight off the cursor, then close the connection."""
+    try:
+        # SQLite does the per-row work in C: LAG() gives the gap to the previous
+        # visit (NULL for the first one), strftime() the local clock time, and
+        # printf() the cleaned, truncated, padded title plus truncated URL.
+        # '%-!70s' pads by characters, not bytes, matching str.ljust.
+        yield from conn.execute(
+            f"""
+            SELECT v.visit_time - LAG(v.visit_time) OVER (ORDER BY v.visit_time) AS gap_us,
+                   strftime('%H:%M:%S', (v.visit_time - :epoch) / 1000000, 'unixepoch', 'localtime'),
+                   v.visit_duration,
+                   printf(
+                       '%-!70s | %s',
+                       substr(replace(replace(COALESCE(u.title, ''), char(10), ' '), char(13), ''), 1, 70),
+                       substr(COALESCE(u.url, ''), 1, 100)
+                   )
+            FROM {visits}
+            JOIN urls u ON v.url = u.id
+            WHERE v.visit_time >= :start AND v.visit_time < :end
+            ORDER BY v.visit_time ASC
+            """,
+            {"epoch": CHROMIUM_EPOCH_OFFSET, "start": ts_start, "end": ts_end},
+        )
     finally:
-        os.unlink(tmp_path)
+        conn.close()
 
 
 def write_output(rows, total, unique, browser_name, date_str, output_path):
-    """Write extracted data to a text file."""
-    with open(output_path, "w", encoding="utf-8") as f:
+    """Stream visits to a text file."""
+    with open(output_path, "w", encoding="utf-8", buffering=1024 * 1024) as f:
         f.write(f"BROWSER HISTORY: {date_str}\n")
         f.write(f"Source: {browser_name} | {total} visits | {unique} unique URLs\n")
         f.write("=" * 90 + "\n\n")
 
-        if not rows:
+        if not total:
             f.write(f"No visits found for {date_str}\n")
-            return
 
-        prev_time = None
-        for visit_time, visit_duration, url, title in rows:
-            dt = chromium_to_local(visit_time)
+        # Format into a list and hand it to the file in large chunks, rather
+        # than paying the text-encoder overhead on one write() per row
+        lines = []
+        for gap_us, time_str, visit_duration, title_and_url in rows:
             dur_str = format_duration(visit_duration)
 
             # Insert gap marker
-            if prev_time is not None:
-                gap_seconds = (visit_time - prev_time) / 1_000_000
-                if gap_seconds >= GAP_THRESHOLD_SECONDS:
-                    gap_hours = gap_seconds / 3600
-                    if gap_hours >= 1:
-                        gap_label = f"{gap_hours:.1f} hours"
-                    else:
-                        gap_label = f"{gap_seconds / 60:.0f} min"
-                    f.write(f"\n--- GAP: {gap_label} ---\n\n")
-
-            safe_title = (title or "").replace("\n", " ").replace("\r", "")[:70]
-            safe_url = url[:100] if url else ""
-            time_str = dt.strftime("%H:%M:%S")
-
-            f.write(f"{time_str} | {dur_str:>8} | {safe_title:<70} | {safe_url}\n")
-            prev_time = visit_time
+            if gap_us is not None and gap_us >= GAP_THRESHOLD_SECONDS * 1_000_000:
+                gap_seconds = gap_us / 1_000_000
+                gap_hours = gap_seconds / 3600
+                if gap_hours >= 1:
+                    gap_label = f"{gap_hours:.1f} hours"
+                else:
+                    gap_label = f"{gap_seconds / 60:.0f} min"
+                lines.append(f"\n--- GAP: {gap_label} ---\n\n")
+
+            lines.append(f"{time_str} | {dur_str:>8} | {title_and_url}\n")
+            if len(lines) >= WRITE_BATCH_LINES:
+                f.write("".join(lines))
+                lines.clear()
+        f.write("".join(lines))
 
 
 def main():
@@ -188,7 +293,7 @@ def main():
     # Extract data
     rows, total, unique = extract_history(db_path, args.date)
     if rows is None:
-        # Copy failed, write empty file
+        # DB unreadable, write empty file
         output_path = os.path.expanduser(args.output)
         with open(output_path, "w", encoding="utf-8") as f:
             f.write(f"BROWSER HISTORY: {args.date}\n")
@@ -165,6 +165,9 @@ store.requestFullAccessToEvents { granted, error in
         print("\(calendar.title) | \(srcType) | \(countStr)")
     }
 
+    // Machine-readable trailer: timed-event count (stripped by calendar_events.py)
+    print("# EVENT_COUNT=\(timedEvents.count)")
+
     semaphore.signal()
 }
 
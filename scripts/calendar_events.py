@@ -21,6 +21,7 @@ Usage:
 """
 
 import argparse
+import hashlib
 import os
 import platform
 import subprocess
@@ -31,26 +32,36 @@ from pathlib import Path
 SCRIPT_DIR = Path(__file__).resolve().parent
 SWIFT_SOURCE = SCRIPT_DIR / "calendar_eventkit.swift"
 SWIFT_BINARY = SCRIPT_DIR / "calendar_eventkit"
+SWIFT_HASH = SWIFT_BINARY.with_suffix(".hash")
 OUTLOOK_SCRIPT = SCRIPT_DIR / "calendar_outlook.ps1"
 
+# Trailer line the platform scripts append with the number of timed events
+EVENT_COUNT_MARKER = "\n# EVENT_COUNT="
+
 
 def compile_swift():
     """Compile the Swift EventKit CLI if needed. Returns True on success."""
+    # Recompile only if the source content changed (mtime alone is too noisy:
+    # editors and git checkouts touch files without changing them)
+    source_hash = hashlib.blake2b(SWIFT_SOURCE.read_bytes(), digest_size=16).hexdigest()
     if SWIFT_BINARY.exists():
-        # Recompile only if source is newer than binary
-        if SWIFT_SOURCE.stat().st_mtime <= SWIFT_BINARY.stat().st_mtime:
-            return True
+        try:
+            if SWIFT_HASH.read_text(encoding="utf-8").strip() == source_hash:
+                return True
+        except FileNotFoundError:
+            pass
 
     print(f"Compiling {SWIFT_SOURCE.name}...")
     try:
         result = subprocess.run(
-            ["swiftc", "-O", str(SWIFT_SOURCE), "-o", str(SWIFT_BINARY),
-             "-framework", "EventKit"],
+            ["swiftc", "-O", "-whole-module-optimization", str(SWIFT_SOURCE),
+             "-o", str(SWIFT_BINARY), "-framework", "EventKit"],
             capture_output=True, text=True, timeout=60,
         )
         if result.returncode != 0:
             print(f"Swift compilation failed: {result.stderr.strip()}", file=sys.stderr)
             return False
+        SWIFT_HASH.write_text(source_hash, encoding="utf-8")
         print("Compilation successful.")
         return True
     except FileNotFoundError:
@@ -120,6 +131,21 @@ def extract_calendars_found(stdout):
             print(line)
 
 
+def split_event_count(stdout):
+    """Split the EVENT_COUNT trailer off the platform script output.
+
+    Returns (body, timed_count). Falls back to counting attendee columns
+    if the script did not emit a trailer.
+    """
+    idx = stdout.rfind(EVENT_COUNT_MARKER)
+    if idx != -1:
+        try:
+            return stdout[:idx + 1], int(stdout[idx + len(EVENT_COUNT_MARKER):])
+        except ValueError:
+            pass
+    return stdout, stdout.count(" attendees")
+
+
 def run_platform_script(system, date_str, calendars=None):
     """Run the appropriate platform script. Returns (stdout, error_reason).
 
@@ -200,6 +226,7 @@ def main():
         if error:
             print(f"Could not retrieve calendars: {error}", file=sys.stderr)
             sys.exit(1)
+        stdout, _ = split_event_count(stdout)
         extract_calendars_found(stdout)
         print()
         print("Use --calendars with identifiers in 'Name (Type)' format, e.g.:")
@@ -214,12 +241,11 @@ def main():
         write_empty(output_path, args.date, error)
         sys.exit(0)
 
-    # Write output
+    # Write output (without the count trailer)
+    stdout, timed = split_event_count(stdout)
     with open(output_path, "w", encoding="utf-8") as f:
         f.write(stdout)
 
-    # Count events for summary
-    timed = stdout.count(" attendees")
     print(f"Extracted calendar events ({timed} timed) to {output_path}")
 
 
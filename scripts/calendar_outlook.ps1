@@ -273,3 +273,6 @@ foreach ($cal in $calendarFolders) {
     }
     Write-Output "$($cal.Name) | $storeLabel | $countStr"
 }
+
+# Machine-readable trailer: timed-event count (stripped by calendar_events.py)
+Write-Output "# EVENT_COUNT=$($timedEvents.Count)"
@@ -37,14 +37,20 @@
 # }
 
 import argparse
+import concurrent.futures
+import functools
 import json
 import math
+import re
 import sys
 from pathlib import Path
 
 ARROW = "\u2192"  # →
 DOT = "\u00b7"  # ·
 
+PLACEHOLDER_RE = re.compile(r"\{\{(\w+)\}\}")
+TEMPLATE_PATH = Path(__file__).resolve().parent / ".." / "assets" / "template.html"
+
 COLOR_MAP = {
     "accent": "var(--accent)", "accent-dim": "var(--accent-dim)",
     "warm": "var(--warm)", "warm-dim": "var(--warm-dim)",
@@ -63,7 +69,55 @@ BORDER_MAP = {
     "text-muted": "var(--border)",
 }
 
-
+# Axis labels for every hour of the day (plus the closing 24)
+HOUR_LABELS = [f"{h:02d}" for h in range(25)]
+
+# Markup for the repeated fragments, bound to str.format once at import time
+LANE_HTML = (
+    '        <div class="lane{lane_class}" data-target="event-{i}">\n'
+    '          <div class="lane-label" style="color:{color}">{short_name}</div>\n'
+    '          <div class="lane-track">\n'
+    '            <div class="lane-bar{bar_class}" style="left:{left}%;{width_style};background:{color};animation-delay:{delay}s" data-tip="{tip}"></div>\n'
+    '          </div>\n'
+    '        </div>\n'
+).format
+AXIS_HTML = '        <span style="left:{pct}%">{label}</span>\n'.format
+TAG_HTML = '          <span class="tag" style="color:{color};border-color:{border}">{text}</span>\n'.format
+EVENT_HTML = (
+    '      <article id="event-{i}" class="event{span_class} reveal" style="--ev-color:{color}">\n'
+    '        <div class="event-meta">\n'
+    '          <time class="event-time">{time_display}</time>\n'
+    '          {msgs_html}\n'
+    '        </div>\n'
+    '        <h3 class="event-title">{title}</h3>\n'
+    '        <p class="event-desc">{description}</p>\n'
+    '        <div class="event-tags">\n'
+    '{tags_html}        </div>\n'
+    '      </article>\n'
+).format
+WORKSPACE_HTML = (
+    '      <div class="ws-row">\n'
+    '        <span class="ws-label">{name}</span>\n'
+    '        <div class="ws-track"><div class="ws-fill" style="width:{percent}%;background:linear-gradient(90deg,{color},{color_dim})"></div></div>\n'
+    '        <span class="ws-num">{count}</span>\n'
+    '      </div>\n'
+).format
+AGENT_HTML = (
+    '      <div class="agent-item">\n'
+    '        <span class="agent-glyph">{icon}</span>\n'
+    '        <span class="agent-name">{name}</span>\n'
+    '        <span class="agent-val">{count}</span>\n'
+    '        <span class="agent-unit">{label}</span>\n'
+    '      </div>\n'
+).format
+
+
+@functools.lru_cache(maxsize=1)
+def load_template():
+    return TEMPLATE_PATH.read_text(encoding="utf-8")
+
+
+@functools.lru_cache(maxsize=128)
 def resolve_color(key):
     return COLOR_MAP.get(key, f"var(--{key})")
 
@@ -73,6 +127,15 @@ def resolve_border(key):
 
 
 def parse_time(time_str):
+    # Fast path for the usual zero-padded "HH:MM" / "HH:MM+": read the digits
+    # directly. Anything else, malformed input included, takes the float path.
+    n = len(time_str)
+    if (n == 5 or (n == 6 and time_str[5] == "+")) and time_str[2] == ":":
+        digits = time_str[:2] + time_str[3:5]
+        if digits.isascii() and digits.isdigit():
+            h = (ord(time_str[0]) - 48) * 10 + (ord(time_str[1]) - 48)
+            m = (ord(time_str[3]) - 48) * 10 + (ord(time_str[4]) - 48)
+            return h + m / 60
     parts = time_str.rstrip("+").split(":")
     return float(parts[0]) + float(parts[1]) / 60
 
@@ -104,17 +167,25 @@ def build_stats(data):
     return "".join(parts)
 
 
-def build_lanes(data, axis_start, axis_span):
+def parse_timeline(timeline):
+    # (start_h, end_h, event) per event; no timeEnd means a nominal 15-minute span
+    parsed = []
+    for t in timeline:
+        start_h = parse_time(t["time"])
+        end_h = parse_time(t["timeEnd"]) if t.get("timeEnd") else start_h + 0.25
+        parsed.append((start_h, end_h, t))
+    return parsed
+
+
+def build_lanes(parsed, axis_start, axis_span):
     # Separate meetings from activities — meetings render first as background layer
-    meetings = [(i, t) for i, t in enumerate(data["timeline"]) if t.get("isMeeting")]
-    activities = [(i, t) for i, t in enumerate(data["timeline"]) if not t.get("isMeeting")]
+    meetings = [(i, p) for i, p in enumerate(parsed) if p[2].get("isMeeting")]
+    activities = [(i, p) for i, p in enumerate(parsed) if not p[2].get("isMeeting")]
 
-    html = ""
+    parts = []
 
     # Meeting lanes (background layer, muted)
-    for i, t in meetings:
-        start_h = parse_time(t["time"])
-        end_h = parse_time(t["timeEnd"]) if t.get("timeEnd") else start_h + 0.25
+    for i, (start_h, end_h, t) in meetings:
         left_pct = round((start_h - axis_start) / axis_span * 100, 2)
         width_pct = round((end_h - start_h) / axis_span * 100, 2)
         bar_color = resolve_color(t["color"])
@@ -125,19 +196,14 @@ def build_lanes(data, axis_start, axis_span):
         tip_text = tip_time
         width_style = "min-width:14px" if width_pct < 2 else f"width:{width_pct}%"
 
-        html += (
-            f'        <div class="lane meeting-lane" data-target="event-{i}">\n'
-            f'          <div class="lane-label" style="color:{bar_color}">{short_name}</div>\n'
-            f'          <div class="lane-track">\n'
-            f'            <div class="lane-bar meeting-bar" style="left:{left_pct}%;{width_style};background:{bar_color};animation-delay:{delay}s" data-tip="{tip_text}"></div>\n'
-            f'          </div>\n'
-            f'        </div>\n'
-        )
+        parts.append(LANE_HTML(
+            lane_class=" meeting-lane", bar_class=" meeting-bar", i=i, color=bar_color,
+            short_name=short_name, left=left_pct, width_style=width_style, delay=delay,
+            tip=tip_text,
+        ))
 
     # Activity lanes (foreground, normal rendering)
-    for i, t in activities:
-        start_h = parse_time(t["time"])
-        end_h = parse_time(t["timeEnd"]) if t.get("timeEnd") else start_h + 0.25
+    for i, (start_h, end_h, t) in activities:
         left_pct = round((start_h - axis_start) / axis_span * 100, 2)
         width_pct = round((end_h - start_h) / axis_span * 100, 2)
         bar_color = resolve_color(t["color"])
@@ -151,29 +217,26 @@ def build_lanes(data, axis_start, axis_span):
         commit_class = " commit-marker" if t.get("isCommit") else ""
         width_style = "min-width:14px" if width_pct < 2 else f"width:{width_pct}%"
 
-        html += (
-            f'        <div class="lane" data-target="event-{i}">\n'
-            f'          <div class="lane-label" style="color:{bar_color}">{short_name}</div>\n'
-            f'          <div class="lane-track">\n'
-            f'            <div class="lane-bar{commit_class}" style="left:{left_pct}%;{width_style};background:{bar_color};animation-delay:{delay}s" data-tip="{tip_text}"></div>\n'
-            f'          </div>\n'
-            f'        </div>\n'
-        )
-    return html
+        parts.append(LANE_HTML(
+            lane_class="", bar_class=commit_class, i=i, color=bar_color,
+            short_name=short_name, left=left_pct, width_style=width_style, delay=delay,
+            tip=tip_text,
+        ))
+    return "".join(parts)
 
 
 def build_axis(axis_start, axis_end, axis_span):
-    html = ""
+    parts = []
     for h in range(axis_start, axis_end + 1):
         pct = round((h - axis_start) / axis_span * 100, 2)
-        label = f"{h:02d}"
-        html += f'        <span style="left:{pct}%">{label}</span>\n'
-    return html
+        label = HOUR_LABELS[h] if h < len(HOUR_LABELS) else f"{h:02d}"
+        parts.append(AXIS_HTML(pct=pct, label=label))
+    return "".join(parts)
 
 
-def build_journal(data):
-    html = ""
-    for i, t in enumerate(data["timeline"]):
+def build_journal(parsed):
+    parts = []
+    for i, (start_h, end_h, t) in enumerate(parsed):
         ev_color = resolve_color(t["color"])
 
         span_class = ""
@@ -184,9 +247,7 @@ def build_journal(data):
                 span_class += " spanning"
                 break
 
-        start_h = parse_time(t["time"])
-        end_h = parse_time(t["timeEnd"]) if t.get("timeEnd") else None
-        if end_h is not None:
+        if t.get("timeEnd"):
             dur = format_duration(end_h - start_h)
             time_display = f"{t['time']} {ARROW} {t['timeEnd']} {DOT} {dur}"
         else:
@@ -199,54 +260,35 @@ def build_journal(data):
         elif t.get("isCommit"):
             msgs_html = '<span class="event-msgs highlight">the commit</span>'
 
-        tags_html = ""
-        for tag in t.get("tags", []):
-            tc = resolve_color(tag["color"])
-            tb = resolve_border(tag["color"])
-            tags_html += f'          <span class="tag" style="color:{tc};border-color:{tb}">{tag["text"]}</span>\n'
-
-        html += (
-            f'      <article id="event-{i}" class="event{span_class} reveal" style="--ev-color:{ev_color}">\n'
-            f'        <div class="event-meta">\n'
-            f'          <time class="event-time">{time_display}</time>\n'
-            f'          {msgs_html}\n'
-            f'        </div>\n'
-            f'        <h3 class="event-title">{t["title"]}</h3>\n'
-            f'        <p class="event-desc">{t["description"]}</p>\n'
-            f'        <div class="event-tags">\n'
-            f'{tags_html}        </div>\n'
-            f'      </article>\n'
+        tags_html = "".join(
+            TAG_HTML(color=resolve_color(tag["color"]), border=resolve_border(tag["color"]),
+                     text=tag["text"])
+            for tag in t.get("tags", [])
         )
-    return html
+
+        parts.append(EVENT_HTML(
+            i=i, span_class=span_class, color=ev_color, time_display=time_display,
+            msgs_html=msgs_html, title=t["title"], description=t["description"],
+            tags_html=tags_html,
+        ))
+    return "".join(parts)
 
 
 def build_workspaces(data):
-    html = ""
+    parts = []
     for w in data["workspaces"]:
-        wc = resolve_color(w["color"])
-        wd = resolve_color(w["colorDim"])
-        html += (
-            f'      <div class="ws-row">\n'
-            f'        <span class="ws-label">{w["name"]}</span>\n'
-            f'        <div class="ws-track"><div class="ws-fill" style="width:{w["percent"]}%;background:linear-gradient(90deg,{wc},{wd})"></div></div>\n'
-            f'        <span class="ws-num">{w["count"]}</span>\n'
-            f'      </div>\n'
-        )
-    return html
+        parts.append(WORKSPACE_HTML(
+            name=w["name"], percent=w["percent"], color=resolve_color(w["color"]),
+            color_dim=resolve_color(w["colorDim"]), count=w["count"],
+        ))
+    return "".join(parts)
 
 
 def build_agents(data):
-    html = ""
+    parts = []
     for a in data["agents"]:
-        html += (
-            f'      <div class="agent-item">\n'
-            f'        <span class="agent-glyph">{a["icon"]}</span>\n'
-            f'        <span class="agent-name">{a["name"]}</span>\n'
-            f'        <span class="agent-val">{a["count"]}</span>\n'
-            f'        <span class="agent-unit">{a["label"]}</span>\n'
-            f'      </div>\n'
-        )
-    return html
+        parts.append(AGENT_HTML(icon=a["icon"], name=a["name"], count=a["count"], label=a["label"]))
+    return "".join(parts)
 
 
 def main():
@@ -255,23 +297,17 @@ def main():
     parser.add_argument("--output-file", required=True, help="Path for output HTML file")
     args = parser.parse_args()
 
-    with open(args.data_file, encoding="utf-8") as f:
-        data = json.load(f)
-
-    template_path = Path(__file__).resolve().parent / ".." / "assets" / "template.html"
-    with open(template_path, encoding="utf-8") as f:
-        html = f.read()
-
-    # Compute time axis range
-    all_starts = []
-    all_ends = []
-    for t in data["timeline"]:
-        s = parse_time(t["time"])
-        all_starts.append(s)
-        all_ends.append(parse_time(t["timeEnd"]) if t.get("timeEnd") else s + 0.25)
-
-    axis_start = math.floor(min(all_starts))
-    axis_end = math.ceil(max(all_ends))
+    # Read the template in the background while the data file is parsed
+    with concurrent.futures.ThreadPoolExecutor(max_workers=1) as pool:
+        template_future = pool.submit(load_template)
+        with open(args.data_file, encoding="utf-8") as f:
+            data = json.load(f)
+        html = template_future.result()
+
+    # Parse timeline times once, then compute the time axis range
+    parsed = parse_timeline(data["timeline"])
+    axis_start = math.floor(min(p[0] for p in parsed))
+    axis_end = math.ceil(max(p[1] for p in parsed))
     axis_span = axis_end - axis_start
 
     # Build HTML fragments
@@ -281,20 +317,19 @@ def main():
         "HEADLINE": data["headline"],
         "SUBTITLE": data["subtitle"],
         "STATS_INLINE": build_stats(data),
-        "DAYMAP_LANES": build_lanes(data, axis_start, axis_span),
+        "DAYMAP_LANES": build_lanes(parsed, axis_start, axis_span),
         "DAYMAP_AXIS": build_axis(axis_start, axis_end, axis_span),
-        "JOURNAL_ITEMS": build_journal(data),
+        "JOURNAL_ITEMS": build_journal(parsed),
         "WORKSPACE_ROWS": build_workspaces(data),
         "AGENT_ITEMS": build_agents(data),
         "HERO_NUMBER": data["heroNumber"],
         "HERO_LABEL": data["heroLabel"],
     }
 
-    for key, value in replacements.items():
-        html = html.replace(f"{{{{{key}}}}}", value)
+    # Single pass over the template; unknown placeholders are left as-is
+    html = PLACEHOLDER_RE.sub(lambda m: replacements.get(m.group(1), m.group(0)), html)
 
-    with open(args.output_file, "w", encoding="utf-8") as f:
-        f.write(html)
+    Path(args.output_file).write_bytes(html.encode("utf-8"))
 
     print(f"Generated: {args.output_file}")
 
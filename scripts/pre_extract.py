@@ -12,33 +12,105 @@ Usage:
 
 import argparse
 import json
+import mmap
+import os
 import subprocess
 import sys
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime, timezone
-from pathlib import Path
+from functools import lru_cache, partial
+from itertools import islice
+from operator import itemgetter
+
+try:
+    # Optional accelerator: orjson decodes JSON several times faster than the
+    # stdlib and takes the raw bytes directly. Everything works without it.
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def _stdlib_json_loads(raw):
+    """Decode JSON from str or bytes, replacing invalid UTF-8 like the text reader did."""
+    if isinstance(raw, bytes):
+        raw = raw.decode("utf-8", errors="replace")
+    return json.loads(raw)
+
+
+if orjson is None:
+    json_loads = _stdlib_json_loads
+else:
+    def json_loads(raw):
+        """Decode JSON with orjson, falling back to the stdlib on invalid UTF-8."""
+        try:
+            return orjson.loads(raw)
+        except orjson.JSONDecodeError:
+            # orjson rejects invalid UTF-8 outright; retry the stdlib way so
+            # such lines keep their text (with replacement characters)
+            return _stdlib_json_loads(raw)
+
 
 # Titles starting with these prefixes are filtered as subagent/teammate sessions
-SKIP_TITLE_PREFIXES = [
+SKIP_TITLE_PREFIXES = (
     "<teammate-message",
     "Your task is to create a detailed summar",
-]
+)
+
+# User messages starting with these are system-generated (local commands, hooks, etc.)
+SYSTEM_USER_PREFIXES = (
+    "<local-command-",
+    "<command-",
+    "<system-reminder>",
+    "<bash-input>",
+    "<bash-stdout>",
+    "<bash-stderr>",
+    "<user-prompt-submit-hook>",
+)
 
 ASSISTANT_TEXT_MAX = 1000
 SAMPLE_SIZE = 5
 
+# Sessions up to this many meaningful entries are output in full
+FULL_SESSION_MAX = 20
 
-def run_cass(args):
-    """Run a cass CLI command and return stdout as string."""
-    result = subprocess.run(
-        ["cass"] + args,
-        capture_output=True,
-        text=True,
-        encoding="utf-8",
-    )
-    if result.returncode != 0:
-        print(f"Warning: cass {' '.join(args)} failed: {result.stderr.strip()}", file=sys.stderr)
+# Slices of bigger sessions hold at most this many entries each
+SAMPLE_SIZE_MAX = 10
+
+# Intermediate sample points for very large sessions, as fractions of the way in
+SAMPLE_POINTS = (
+    ("EARLY in session", 0.25),
+    ("MIDDLE of session", 0.5),
+    ("LATE in session", 0.75),
+)
+
+# Session files bigger than this are memory-mapped rather than read line by line
+MMAP_MIN_BYTES = 64 * 1024
+
+
+def start_cass(args):
+    """Launch a cass CLI command without waiting for it (see finish_cass)."""
+    return subprocess.Popen(["cass"] + args, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+
+
+def finish_cass(proc):
+    """Wait for a start_cass command and return stdout as raw bytes.
+
+    Every caller parses the output as JSON, and json_loads takes bytes
+    directly, so the output is never decoded into an intermediate str.
+    """
+    stdout, stderr = proc.communicate()
+    if proc.returncode != 0:
+        stderr = stderr.decode("utf-8", errors="replace").strip()
+        print(f"Warning: cass {' '.join(proc.args[1:])} failed: {stderr}", file=sys.stderr)
         return None
-    return result.stdout
+    return stdout
+
+
+def run_cass(args):
+    """Run a cass CLI command and return stdout as raw bytes."""
+    return finish_cass(start_cass(args))
 
 
 def discover_sessions(from_dt, until_dt):
@@ -52,7 +124,7 @@ def discover_sessions(from_dt, until_dt):
     if not raw:
         return [], 0
 
-    data = json.loads(raw)
+    data = json_loads(raw)
     all_sessions = data.get("sessions", [])
     total_before_filter = len(all_sessions)
 
@@ -67,22 +139,31 @@ def discover_sessions(from_dt, until_dt):
         if started < from_ts or started > until_ts:
             continue
         # Filter out subagent sessions by path (subagents live under /subagents/)
+        # Plain substring test instead of building a Path per session; padding
+        # with separators keeps it to whole path components on either OS
         source = s.get("source_path", "")
-        if "subagents" in Path(source).parts:
+        if "/subagents/" in f"/{source}/".replace("\\", "/"):
             continue
         # Filter out teammate/subagent sessions by title
         title = s.get("title", "")
-        if any(title.startswith(prefix) for prefix in SKIP_TITLE_PREFIXES):
+        if title.startswith(SKIP_TITLE_PREFIXES):
             continue
-        filtered.append(s)
+        # Keep the start time already looked up above as the sort key
+        filtered.append((started, s))
 
     # Sort by start time ascending
-    filtered.sort(key=lambda s: s.get("started_at", 0))
-    return filtered, total_before_filter - len(filtered)
+    filtered.sort(key=itemgetter(0))
+    return [s for _, s in filtered], total_before_filter - len(filtered)
 
 
+@lru_cache(maxsize=32)
 def parse_iso_to_epoch_ms(dt_str):
     """Convert ISO datetime string to epoch milliseconds. Handles dates and datetimes."""
+    # Fast path: fromisoformat is C-implemented and covers all the formats below
+    try:
+        return int(datetime.fromisoformat(dt_str).timestamp() * 1000)
+    except ValueError:
+        pass
     for fmt in ["%Y-%m-%dT%H:%M:%S", "%Y-%m-%dT%H:%M", "%Y-%m-%d"]:
         try:
             dt = datetime.strptime(dt_str, fmt)
@@ -94,108 +175,163 @@ def parse_iso_to_epoch_ms(dt_str):
     return 0
 
 
-def parse_jsonl(path):
-    """Read a .jsonl session file, return list of parsed entries."""
-    entries = []
-    p = Path(path)
-    if not p.exists():
+def iter_session_lines(path):
+    """Yield (offset, line) for each non-blank line of a .jsonl session file.
+
+    offset is the byte position of the line, so it can be re-read later
+    with read_meaningful_at. Lines are left undecoded, so callers can skip
+    the ones they don't need before paying for JSON parsing.
+    """
+    # Just try to open it: an exists() check first would cost a second syscall
+    # per session, and the file could still vanish in between.
+    # Binary mode: lines go to the decoder as bytes, skipping the text layer
+    try:
+        f = open(path, "rb")
+    except FileNotFoundError:
         print(f"Warning: session file not found: {path}", file=sys.stderr)
-        return entries
-    with open(p, encoding="utf-8", errors="replace") as f:
-        for line in f:
+        return
+    with f:
+        for offset, line in iter_lines(f):
             line = line.strip()
-            if not line:
-                continue
-            try:
-                entries.append(json.loads(line))
-            except json.JSONDecodeError:
-                continue
-    return entries
-
-
-
-def extract_meaningful(entries):
-    """Filter to user text messages and assistant text messages.
-    Returns list of (role, text, tools_list) tuples."""
-    meaningful = []
-    for entry in entries:
-        etype = entry.get("type")
-        msg = entry.get("message", {})
-        role = msg.get("role")
-        content = msg.get("content")
-
-        if etype == "user" and role == "user":
-            # User message with plain text (not tool_result array)
-            if isinstance(content, str) and content.strip():
-                text = content.strip()
-                # Skip system-generated user messages (local commands, hooks, etc.)
-                if text.startswith(("<local-command-", "<command-", "<system-reminder>",
-                                    "<bash-input>", "<bash-stdout>", "<bash-stderr>",
-                                    "<user-prompt-submit-hook>")):
-                    continue
-                meaningful.append(("user", text, []))
-
-        elif etype == "assistant" and role == "assistant":
-            if isinstance(content, list):
-                texts = []
-                tools = []
-                for block in content:
-                    if block.get("type") == "text":
-                        t = block.get("text", "").strip()
-                        if t:
-                            texts.append(t)
-                    elif block.get("type") == "tool_use":
-                        tools.append(block.get("name", "unknown"))
-                    # Skip thinking blocks
-                if texts:
-                    meaningful.append(("assistant", "\n".join(texts), tools))
-
-    return meaningful
-
-
-def sample_entries(meaningful, sample_size=SAMPLE_SIZE):
-    """Pick sample slices from a list of meaningful entries.
+            if line:
+                yield offset, line
+
+
+def iter_lines(f):
+    """Yield (offset, line) for the raw lines of a file opened in binary mode.
+
+    Large files are memory-mapped and split with mmap.find, which scans for
+    newlines in C straight over the page cache instead of refilling a read
+    buffer. Small (and empty, which mmap rejects) files are iterated as usual.
+    """
+    size = os.fstat(f.fileno()).st_size
+    pos = 0
+    if size <= MMAP_MIN_BYTES:
+        for line in f:
+            yield pos, line
+            pos += len(line)
+        return
+    with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        find = mm.find
+        while pos < size:
+            end = find(b"\n", pos)
+            if end == -1:
+                end = size
+            yield pos, mm[pos:end]
+            pos = end + 1
+
+
+def classify_entry(entry):
+    """Reduce a user or assistant text message to a (role, text, tools_list) tuple.
+
+    Returns None for everything else (tool results, system-generated
+    messages, thinking-only or tool-only turns, summaries...).
+    """
+    etype = entry.get("type")
+    msg = entry.get("message", {})
+    role = msg.get("role")
+    content = msg.get("content")
+
+    if etype == "user" and role == "user":
+        # User message with plain text (not tool_result array)
+        if isinstance(content, str) and content.strip():
+            text = content.strip()
+            # Skip system-generated user messages (local commands, hooks, etc.)
+            if text.startswith(SYSTEM_USER_PREFIXES):
+                return None
+            return ("user", text, [])
+
+    elif etype == "assistant" and role == "assistant":
+        if isinstance(content, list):
+            texts = []
+            tools = []
+            for block in content:
+                if block.get("type") == "text":
+                    t = block.get("text", "").strip()
+                    if t:
+                        texts.append(t)
+                elif block.get("type") == "tool_use":
+                    tools.append(block.get("name", "unknown"))
+                # Skip thinking blocks
+            if texts:
+                return ("assistant", "\n".join(texts), tools)
+
+    return None
+
+
+def iter_meaningful(path, ctx=None):
+    """Yield (offset, (role, text, tools_list)) for each meaningful message.
+
+    Each entry is classified as soon as it is decoded, so only the small
+    tuples outlive the loop, never the raw dicts. If ctx is given,
+    ctx["workspace"] is set to the first cwd seen on the way.
+    """
+    need_cwd = ctx is not None
+    for offset, line in iter_session_lines(path):
+        # Every user or assistant message carries its type as a JSON string
+        # token, so a line with neither can't classify as meaningful. Once the
+        # workspace is known such lines (summaries, snapshots, progress...)
+        # are skipped without being decoded at all.
+        if not need_cwd and b'"user"' not in line and b'"assistant"' not in line:
+            continue
+        try:
+            entry = json_loads(line)
+        except ValueError:
+            continue
+        if need_cwd:
+            cwd = entry.get("cwd")
+            if cwd:
+                ctx["workspace"] = cwd
+                need_cwd = False
+        item = classify_entry(entry)
+        if item is not None:
+            yield offset, item
+
+
+def read_meaningful_at(path, offsets):
+    """Re-read the meaningful entries starting at the given byte offsets."""
+    items = []
+    with open(path, "rb") as f:
+        for offset in offsets:
+            f.seek(offset)
+            items.append(classify_entry(json_loads(f.readline().strip())))
+    return items
+
+
+def sample_plan(n, sample_size=SAMPLE_SIZE):
+    """Pick the sample slices for a session with n meaningful entries.
 
     Adaptive: more sample points for bigger sessions.
-    - < 20 entries: full session (returned as single list)
+    - < 20 entries: full session (returned as single slice)
     - 20-60: START + END
     - 61-150: START + MIDDLE + END
     - 151+: START + evenly spaced intermediate points + END
 
-    Returns list of (label, entries_list) tuples for flexible formatting.
+    Returns list of (label, start, stop) index ranges.
     """
-    n = len(meaningful)
-
-    if n <= 20:
-        return [("FULL SESSION", meaningful)]
+    if n <= FULL_SESSION_MAX:
+        return [("FULL SESSION", 0, n)]
 
     # Adaptive sample size: bigger sessions get bigger slices
-    ss = min(10, max(sample_size, n // 20))
+    ss = min(SAMPLE_SIZE_MAX, max(sample_size, n // 20))
 
     if n <= 60:
-        return [
-            ("START of session", meaningful[:ss]),
-            ("END of session", meaningful[-ss:]),
-        ]
-
-    if n <= 150:
+        points = []
+    elif n <= 150:
         mid = n // 2
-        mid_start = max(ss, mid - ss // 2)
-        return [
-            ("START of session", meaningful[:ss]),
-            (f"MIDDLE of session - around message {mid}", meaningful[mid_start:mid_start + ss]),
-            ("END of session", meaningful[-ss:]),
-        ]
-
-    # Very large session: 5 sample points
-    # Evenly space 3 intermediate points between start and end
-    sections = [("START of session", meaningful[:ss])]
-    for i, frac in enumerate([0.25, 0.5, 0.75]):
-        idx = int(n * frac)
-        label = ["EARLY in session", "MIDDLE of session", "LATE in session"][i]
-        sections.append((f"{label} - around message {idx}", meaningful[idx:idx + ss]))
-    sections.append(("END of session", meaningful[-ss:]))
-    return sections
+        points = [(f"MIDDLE of session - around message {mid}", max(ss, mid - ss // 2))]
+    else:
+        # Very large session: evenly space 3 intermediate points between start and end
+        points = []
+        for label, frac in SAMPLE_POINTS:
+            idx = int(n * frac)
+            points.append((f"{label} - around message {idx}", idx))
+
+    return (
+        [("START of session", 0, ss)]
+        + [(label, start, start + ss) for label, start in points]
+        + [("END of session", n - ss, n)]
+    )
 
 
 def truncate(text, max_len=ASSISTANT_TEXT_MAX):
@@ -205,11 +341,12 @@ def truncate(text, max_len=ASSISTANT_TEXT_MAX):
     return text[:max_len].rstrip() + "..."
 
 
-def format_session(session_meta, meaningful, sample_size=SAMPLE_SIZE):
-    """Format one session into text output."""
-    lines = []
+def format_session(session_meta, workspace, sections):
+    """Format one session's sample sections.
+
+    Yields blocks of text that join with newlines into the session output.
+    """
     title = session_meta.get("title", "Untitled")[:80]
-    workspace = session_meta.get("workspace", "unknown")
     msg_count = session_meta.get("message_count", 0)
 
     started = session_meta.get("started_at", 0)
@@ -217,123 +354,158 @@ def format_session(session_meta, meaningful, sample_size=SAMPLE_SIZE):
     start_time = format_epoch_ms(started)
     end_time = format_epoch_ms(ended)
 
-    lines.append(f"Title: {title}")
-    lines.append(f"Workspace: {workspace}")
-    lines.append(f"Time: {start_time} - {end_time} | Messages: {msg_count}")
-    lines.append("---")
-    lines.append("")
+    yield f"Title: {title}\nWorkspace: {workspace}\nTime: {start_time} - {end_time} | Messages: {msg_count}\n---\n"
 
-    if not meaningful:
-        lines.append("[NO MEANINGFUL CONTENT]")
-        return "\n".join(lines)
-
-    sections = sample_entries(meaningful, sample_size)
+    if not sections:
+        yield "[NO MEANINGFUL CONTENT]"
+        return
 
     for label, entries in sections:
-        lines.append(f"[{label}]")
-        lines.append("")
+        yield f"[{label}]\n"
         for role, text, tools in entries:
-            lines.extend(format_entry(role, text, tools))
-
-    return "\n".join(lines)
+            yield format_entry(role, text, tools)
 
 
 def format_entry(role, text, tools):
-    """Format a single meaningful entry into output lines."""
-    lines = []
+    """Format a single meaningful entry, followed by its blank separator line."""
     if role == "user":
-        lines.append(f"USER: {text}")
-    else:
-        lines.append(f"ASSISTANT: {truncate(text)}")
-        if tools:
-            lines.append(f"[used tools: {', '.join(tools)}]")
-    lines.append("")
-    return lines
+        return f"USER: {text}\n"
+    if tools:
+        return f"ASSISTANT: {truncate(text)}\n[used tools: {', '.join(tools)}]\n"
+    return f"ASSISTANT: {truncate(text)}\n"
 
 
 def format_epoch_ms(epoch_ms):
     """Convert epoch milliseconds to HH:MM string."""
     if not epoch_ms:
         return "??:??"
-    dt = datetime.fromtimestamp(epoch_ms / 1000)
-    return dt.strftime("%H:%M")
-
-
-def get_workspace_from_entries(entries):
-    """Extract workspace (cwd) from the first user entry in parsed JSONL."""
-    for entry in entries:
-        cwd = entry.get("cwd")
-        if cwd:
-            return cwd
-    return "unknown"
-
-
-def write_output(output_path, sessions, session_contents, filtered_count):
-    """Write the formatted text file."""
-    lines = []
-    lines.append("=" * 50)
-    lines.append("PRE-EXTRACTED SESSIONS")
-    lines.append(f"Sessions: {len(sessions)} ({filtered_count} filtered as subagent/teammate)")
-    lines.append(f"Generated: {datetime.now().strftime('%Y-%m-%dT%H:%M:%S')}")
-    lines.append("=" * 50)
-    lines.append("")
-
-    if not sessions:
-        lines.append("No sessions found in this time range.")
-    else:
-        for i, (session, content) in enumerate(zip(sessions, session_contents)):
-            lines.append(f"--- SESSION {i + 1} of {len(sessions)} ---")
-            lines.append(content)
-            lines.append("")
-
-    lines.append("=" * 50)
-    lines.append("END OF PRE-EXTRACTED SESSIONS")
-    lines.append("=" * 50)
+    # time.localtime is a direct C call; no datetime object or strftime parse
+    tm = time.localtime(epoch_ms // 1000)
+    return f"{tm.tm_hour:02d}:{tm.tm_min:02d}"
 
-    Path(output_path).parent.mkdir(parents=True, exist_ok=True)
-    with open(output_path, "w", encoding="utf-8") as f:
-        f.write("\n".join(lines))
-    print(f"Extracted {len(sessions)} sessions to {output_path}")
 
+def process_session(session_meta, sample_size=SAMPLE_SIZE):
+    """Parse and format one session.
 
-def gather_stats(from_dt, until_dt):
-    """Run CASS aggregate commands and return stats dict."""
+    Returns the formatted content, or None if the session has no
+    meaningful content. session_meta is only read: it is not mutated, nor
+    shipped back from the worker process.
+    """
+    source_path = session_meta.get("source_path", "")
+    ctx = {"workspace": "unknown"}
+    # Sampling only ever needs the first FULL_SESSION_MAX and the last
+    # SAMPLE_SIZE_MAX entries, so only those are kept. Everything else is
+    # remembered by byte offset and re-read if a middle slice lands on it.
+    head = []
+    tail = deque(maxlen=SAMPLE_SIZE_MAX)
+    offsets = []
+    for offset, item in iter_meaningful(source_path, ctx):
+        if len(offsets) < FULL_SESSION_MAX:
+            head.append(item)
+        tail.append(item)
+        offsets.append(offset)
+
+    n = len(offsets)
+    if not n:
+        return None
+    tail_start = n - len(tail)
+    sections = []
+    # format_session walks each section once, in order, so slices served
+    # from head and tail are lazy islice views rather than copies
+    for label, start, stop in sample_plan(n, sample_size):
+        if stop <= len(head):
+            entries = islice(head, start, stop)
+        elif start >= tail_start:
+            entries = islice(tail, start - tail_start, stop - tail_start)
+        else:
+            entries = read_meaningful_at(source_path, offsets[start:stop])
+        sections.append((label, entries))
+
+    # Joined here: the content has to cross the process boundary as one string
+    return "\n".join(format_session(session_meta, ctx["workspace"], sections))
+
+
+def write_output(output_path, session_contents, filtered_count):
+    """Write the formatted text file, streaming each piece straight to disk."""
+    os.makedirs(os.path.dirname(output_path) or ".", exist_ok=True)
+    with open(output_path, "w", encoding="utf-8", buffering=1024 * 1024) as f:
+        f.write("=" * 50 + "\n")
+        f.write("PRE-EXTRACTED SESSIONS\n")
+        f.write(f"Sessions: {len(session_contents)} ({filtered_count} filtered as subagent/teammate)\n")
+        f.write(f"Generated: {datetime.now().strftime('%Y-%m-%dT%H:%M:%S')}\n")
+        f.write("=" * 50 + "\n\n")
+
+        if not session_contents:
+            f.write("No sessions found in this time range.\n")
+        else:
+            for i, content in enumerate(session_contents):
+                f.write(f"--- SESSION {i + 1} of {len(session_contents)} ---\n")
+                f.write(content)
+                f.write("\n\n")
+
+        f.write("=" * 50 + "\n")
+        f.write("END OF PRE-EXTRACTED SESSIONS\n")
+        f.write("=" * 50)
+    print(f"Extracted {len(session_contents)} sessions to {output_path}")
+
+
+def start_stats(from_dt, until_dt):
+    """Launch the CASS aggregate commands for gather_stats, without waiting.
+
+    The queries are independent of each other and of the session data, and
+    their time goes into cass start-up and I/O, so they run as concurrent
+    processes while the caller gets on with other work.
+    """
+    commands = [
+        # Workspace breakdown
+        [
+            "search", "the",
+            "--since", from_dt, "--until", until_dt,
+            "--limit", "500", "--json",
+            "--aggregate", "workspace",
+            "--max-tokens", "1000",
+        ],
+        # Agent breakdown (no --agent filter to get all agents)
+        [
+            "search", "the",
+            "--since", from_dt, "--until", until_dt,
+            "--limit", "500", "--json",
+            "--aggregate", "agent",
+            "--max-tokens", "1000",
+        ],
+        # Timeline for session count and hourly distribution
+        [
+            "timeline", "--json", "--group-by", "hour",
+            "--since", from_dt, "--until", until_dt,
+        ],
+    ]
+    return [start_cass(command) for command in commands]
+
+
+def gather_stats(from_dt, until_dt, procs=None):
+    """Collect the CASS aggregate commands and return stats dict.
+
+    procs are the running commands from start_stats; they are launched
+    here if not given.
+    """
+    if procs is None:
+        procs = start_stats(from_dt, until_dt)
+    workspace_raw, agent_raw, timeline_raw = [finish_cass(proc) for proc in procs]
     stats = {"timeRange": {"from": from_dt, "until": until_dt}}
 
-    # Workspace breakdown
-    raw = run_cass([
-        "search", "the",
-        "--since", from_dt, "--until", until_dt,
-        "--limit", "500", "--json",
-        "--aggregate", "workspace",
-        "--max-tokens", "1000",
-    ])
-    if raw:
-        data = json.loads(raw)
+    if workspace_raw:
+        data = json_loads(workspace_raw)
         stats["totalMatches"] = data.get("total_matches", 0)
         buckets = data.get("aggregations", {}).get("workspace", {}).get("buckets", [])
         stats["workspaces"] = [{"name": b["key"], "count": b["count"]} for b in buckets]
 
-    # Agent breakdown (no --agent filter to get all agents)
-    raw = run_cass([
-        "search", "the",
-        "--since", from_dt, "--until", until_dt,
-        "--limit", "500", "--json",
-        "--aggregate", "agent",
-        "--max-tokens", "1000",
-    ])
-    if raw:
-        data = json.loads(raw)
+    if agent_raw:
+        data = json_loads(agent_raw)
         buckets = data.get("aggregations", {}).get("agent", {}).get("buckets", [])
         stats["agents"] = [{"name": b["key"], "count": b["count"]} for b in buckets]
 
-    # Timeline for session count and hourly distribution
-    raw = run_cass([
-        "timeline", "--json", "--group-by", "hour",
-        "--since", from_dt, "--until", until_dt,
-    ])
-    if raw:
-        data = json.loads(raw)
+    if timeline_raw:
+        data = json_loads(timeline_raw)
         stats["totalSessions"] = data.get("total_sessions", 0)
         # Build hourly distribution from groups (dict: "YYYY-MM-DD HH:00" -> [sessions])
         hourly = {}
@@ -364,38 +536,45 @@ def main():
                         help=f"Messages per sample slice (default: {SAMPLE_SIZE})")
     args = parser.parse_args()
 
+    # Stats don't depend on the sessions, so start their cass commands now and
+    # let them run alongside discovery and extraction instead of after them
+    stats_procs = start_stats(args.from_dt, args.until) if args.stats_output else None
+
     # Discover sessions
     print(f"Discovering sessions from {args.from_dt} to {args.until}...")
     sessions, filtered_count = discover_sessions(args.from_dt, args.until)
     print(f"Found {len(sessions)} sessions ({filtered_count} filtered)")
 
-    # Extract content from each session, skip empty ones
-    kept_sessions = []
-    session_contents = []
-    skipped_empty = 0
-    for s in sessions:
-        source_path = s.get("source_path", "")
-        entries = parse_jsonl(source_path)
-        s["workspace"] = get_workspace_from_entries(entries)
-        meaningful = extract_meaningful(entries)
-        if not meaningful:
-            skipped_empty += 1
-            continue
-        content = format_session(s, meaningful, args.sample_size)
-        kept_sessions.append(s)
-        session_contents.append(content)
+    # cass already reports each session's message count: one with no
+    # messages can't have meaningful content, so don't even open its file
+    to_parse = [s for s in sessions if s.get("message_count") != 0]
+    skipped_empty = len(sessions) - len(to_parse)
+
+    # Extract content from each session, skip empty ones. Sessions are
+    # independent files and decoding is CPU-bound, so spread them over
+    # processes (threads would serialise on the GIL); map() keeps the order.
+    work = partial(process_session, sample_size=args.sample_size)
+    workers = min(os.cpu_count() or 1, len(to_parse))
+    if workers > 1:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            results = list(executor.map(work, to_parse, chunksize=max(1, len(to_parse) // (workers * 4))))
+    else:
+        results = [work(s) for s in to_parse]
+
+    session_contents = [content for content in results if content is not None]
+    skipped_empty += len(results) - len(session_contents)
 
     if skipped_empty:
         print(f"Skipped {skipped_empty} sessions with no meaningful content")
 
     # Write output
-    write_output(args.output, kept_sessions, session_contents, filtered_count + skipped_empty)
+    write_output(args.output, session_contents, filtered_count + skipped_empty)
 
     # Gather stats if requested
     if args.stats_output:
         print("Gathering stats...")
-        stats = gather_stats(args.from_dt, args.until)
-        Path(args.stats_output).parent.mkdir(parents=True, exist_ok=True)
+        stats = gather_stats(args.from_dt, args.until, stats_procs)
+        os.makedirs(os.path.dirname(args.stats_output) or ".", exist_ok=True)
         with open(args.stats_output, "w", encoding="utf-8") as f:
             json.dump(stats, f, indent=2)
         print(f"Stats written to {args.stats_output}")